@@ -1,24 +1,41 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
+from matplotlib.backend_bases import TimerBase
 import matplotlib.gridspec as gridspec
+from matplotlib.patches import Polygon
+
+# Equilibrium label text, formatted on every update
+EQ_LABEL_FMT = "Price: {price:.2f}\nQuantity: {quantity:.2f}".format
+# Welfare metrics table values
+VALUE_FMT = "{:.2f}".format
 
 
 class MarketSimulator:
+    # History record layout: one row per update
+    HISTORY_DTYPE = np.dtype([('tax', 'f4'), ('demand_elasticity', 'f4'), ('supply_elasticity', 'f4'),
+                              ('price', 'f4'), ('quantity', 'f4'), ('welfare', 'f4')])
+
     def __init__(self, demand_elasticity=-3.0, supply_elasticity=3.0):
         # Market parameters
         self.base_demand = 100  # Base demand quantity
         self.base_supply = 100  # Base supply quantity
         self.demand_elasticity = demand_elasticity  # Demand elasticity
         self.supply_elasticity = supply_elasticity  # Supply elasticity
+        self._initial_elasticities = (demand_elasticity, supply_elasticity)  # Restored by reset
         self.tax_rate = 0.0  # Initial tax rate
-        self.history = []  # History records
+        self.history = np.empty(1024, dtype=self.HISTORY_DTYPE)  # History records
+        self._history_size = 0  # Number of filled history rows
+        self._eq_cache = {}  # Equilibrium results by tax rate
+        self._welfare_cache = {}  # Welfare results by tax rate and equilibrium
+        self._welfare_out = np.empty(5)  # Reused calculate_welfare result
 
         # Calculate initial curves and equilibrium
-        self.update_curves()
+        self.update_intercepts()
+        self.find_equilibrium()
 
-    def update_curves(self):
-        """Update curves when elasticity or tax changes"""
+    def update_intercepts(self):
+        """Update curve intercepts when elasticity changes"""
         # Calculate demand curve intercept (maximum willingness to pay)
         # Using equilibrium condition at base point (P=10, Q=100)
         self.demand_intercept = 10 - 100 / self.demand_elasticity
@@ -26,44 +43,85 @@ class MarketSimulator:
         # Calculate supply curve intercept (minimum acceptable price)
         self.supply_intercept = 10 - 100 / self.supply_elasticity
 
-        # Find current equilibrium
-        self.find_equilibrium()
+        # Cached results belong to the old curves
+        self._eq_cache.clear()
+        self._welfare_cache.clear()
+
+        # Constant terms of the curves and the equilibrium denominator, so that
+        # D(P) = de * P - _de_di, S(P) = se * P - _se_si and
+        # P* = (se * tax + _se_si - _de_di) * _eq_denom_inv
+        self._de_di = self.demand_elasticity * self.demand_intercept
+        self._se_si = self.supply_elasticity * self.supply_intercept
+        self._eq_denom_inv = 1.0 / (self.supply_elasticity - self.demand_elasticity)
+
+        # Zero-tax equilibrium and welfare only depend on the curves, cache them
+        # (same analytical solution as find_equilibrium with tax_rate = 0)
+        self._zero_tax_price = (self._se_si - self._de_di) * self._eq_denom_inv
+        self._zero_tax_quantity = max(0, self.demand_function(self._zero_tax_price))
+        zero_tax_cs = 0.5 * (self.demand_intercept - self._zero_tax_price) * self._zero_tax_quantity
+        zero_tax_ps = 0.5 * (self._zero_tax_price - self.supply_intercept) * self._zero_tax_quantity
+        self._zero_tax_welfare = zero_tax_cs + zero_tax_ps
 
     def demand_function(self, price):
         """Demand function calculation"""
-        return self.demand_elasticity * (price - self.demand_intercept)
+        return self.demand_elasticity * price - self._de_di
 
     def supply_function(self, price):
         """Supply function calculation"""
-        return self.supply_elasticity * (price - self.supply_intercept)
+        return self.supply_elasticity * price - self._se_si
 
     def taxed_supply_function(self, price):
         """Taxed supply function calculation"""
         # Price received by producers is consumer price minus tax
         producer_price = price - self.tax_rate
-        return self.supply_elasticity * (producer_price - self.supply_intercept)
+        return self.supply_elasticity * producer_price - self._se_si
 
     def find_equilibrium(self):
         """Find market equilibrium point"""
         # Find where demand equals taxed supply
         # Solve: demand_elasticity * (P - demand_intercept) = supply_elasticity * ((P - tax_rate) - supply_intercept)
 
-        # Analytical solution
-        numerator = (self.supply_elasticity * (self.tax_rate + self.supply_intercept)
-                     - self.demand_elasticity * self.demand_intercept)
-        denominator = self.supply_elasticity - self.demand_elasticity
+        # Without tax the equilibrium is the one cached in update_intercepts
+        if self.tax_rate == 0.0:
+            self.equilibrium_price = self._zero_tax_price
+            self.equilibrium_quantity = self._zero_tax_quantity
+            return self.equilibrium_price, self.equilibrium_quantity
+
+        # Tax slider moves in fixed steps, so reuse results for tax rates already seen
+        cached = self._eq_cache.get(self.tax_rate)
+        if cached is not None:
+            self.equilibrium_price, self.equilibrium_quantity = cached
+            return cached
+
+        # Analytical solution (constant terms precomputed in update_intercepts)
+        numerator = self.supply_elasticity * self.tax_rate + self._se_si - self._de_di
 
         # Calculate equilibrium price and quantity
-        self.equilibrium_price = numerator / denominator
+        self.equilibrium_price = numerator * self._eq_denom_inv
         self.equilibrium_quantity = self.demand_function(self.equilibrium_price)
 
         # Ensure non-negative quantity
         self.equilibrium_quantity = max(0, self.equilibrium_quantity)
 
+        self._eq_cache[self.tax_rate] = (self.equilibrium_price, self.equilibrium_quantity)
         return self.equilibrium_price, self.equilibrium_quantity
 
+    def find_zero_tax_equilibrium(self):
+        """Find market equilibrium without tax (does not touch tax_rate)"""
+        # Computed in update_intercepts
+        return self._zero_tax_price, self._zero_tax_quantity
+
     def calculate_welfare(self):
-        """Calculate social welfare"""
+        """Calculate social welfare (CS, PS, tax revenue, total, DWL) into a reused array"""
+        welfare = self._welfare_out
+        # Key on the equilibrium actually used, not just the tax rate, so a call made
+        # before find_equilibrium cannot poison the cache
+        key = (self.tax_rate, self.equilibrium_price, self.equilibrium_quantity)
+        cached = self._welfare_cache.get(key)
+        if cached is not None:
+            welfare[:] = cached
+            return welfare
+
         # Consumer price is equilibrium price
         consumer_price = self.equilibrium_price
         # Producer price is consumer price minus tax
@@ -82,56 +140,145 @@ class MarketSimulator:
         # 4. Total welfare
         total_welfare = consumer_surplus + producer_surplus + tax_revenue
 
-        # 5. Deadweight loss - difference from zero-tax welfare
-        # Calculate zero-tax welfare
-        original_tax = self.tax_rate
-        self.tax_rate = 0
-        zero_tax_price, zero_tax_quantity = self.find_equilibrium()
-        zero_tax_cs = 0.5 * (self.demand_intercept - zero_tax_price) * zero_tax_quantity
-        zero_tax_ps = 0.5 * (zero_tax_price - self.supply_intercept) * zero_tax_quantity
-        zero_tax_total = zero_tax_cs + zero_tax_ps
+        # 5. Deadweight loss - difference from zero-tax welfare (cached in update_intercepts)
+        deadweight_loss = max(0, self._zero_tax_welfare - total_welfare)
+
+        welfare[0] = consumer_surplus
+        welfare[1] = producer_surplus
+        welfare[2] = tax_revenue
+        welfare[3] = total_welfare
+        welfare[4] = deadweight_loss
+        self._welfare_cache[key] = welfare.copy()
+        return welfare
+
+    def sweep_tax(self, tax_rates):
+        """Calculate equilibrium and welfare for an array of tax rates at once"""
+        # Same formulas as find_equilibrium and calculate_welfare, broadcast over tax_rates
+        tax_rates = np.asarray(tax_rates, dtype=float)
+        prices = (self.supply_elasticity * tax_rates + self._se_si - self._de_di) * self._eq_denom_inv
+        quantities = np.maximum(0, self.demand_function(prices))
+
+        consumer_surplus = 0.5 * (self.demand_intercept - prices) * quantities
+        producer_surplus = 0.5 * (prices - tax_rates - self.supply_intercept) * quantities
+        tax_revenue = tax_rates * quantities
+        total_welfare = consumer_surplus + producer_surplus + tax_revenue
+        deadweight_loss = np.maximum(0, self._zero_tax_welfare - total_welfare)
 
-        # Restore actual tax rate
-        self.tax_rate = original_tax
+        return prices, quantities, consumer_surplus, producer_surplus, tax_revenue, total_welfare, deadweight_loss
 
-        deadweight_loss = max(0, zero_tax_total - total_welfare)
+    def record_history(self, total_welfare):
+        """Append current tax, elasticities, equilibrium and total welfare to history"""
+        # Grow storage geometrically when full
+        if self._history_size == self.history.size:
+            self.history = np.resize(self.history, self.history.size * 2)
 
-        return consumer_surplus, producer_surplus, tax_revenue, total_welfare, deadweight_loss
+        self.history[self._history_size] = (self.tax_rate, self.demand_elasticity, self.supply_elasticity,
+                                            self.equilibrium_price, self.equilibrium_quantity, total_welfare)
+        self._history_size += 1
 
+    def reset(self):
+        """Reset tax rate, elasticities and history to their initial values in place"""
+        self.tax_rate = 0.0
+        self._history_size = 0
+        self.demand_elasticity, self.supply_elasticity = self._initial_elasticities
 
-def create_interactive_game():
-    """Create interactive game interface with adjustable elasticities"""
-    # Initialize simulator
-    sim = MarketSimulator()
+        # Recompute intercepts (also clears the cached results) and equilibrium
+        self.update_intercepts()
+        self.find_equilibrium()
 
-    # Create figure with custom grid layout
-    fig = plt.figure(figsize=(12, 8))
+    def get_history(self):
+        """Return recorded history as a structured array view"""
+        return self.history[:self._history_size]
+
+
+# Figure shared by successive create_interactive_game calls, and the hooks
+# that detach the previous game's widgets and callbacks from it
+_FIG = None
+_FIG_TEARDOWN = []
+
+
+def _build_layout():
+    """Create the game figure and main axes, reusing the figure of a previous game"""
+    global _FIG
+    if _FIG is not None and plt.fignum_exists(_FIG.number):
+        # Detach the previous game before clearing its artists
+        for teardown in _FIG_TEARDOWN:
+            teardown()
+        _FIG.clf()
+        plt.figure(_FIG.number)  # Make it the current figure again
+    else:
+        # Fixed manual layout: never let rcParams enable a layout engine that
+        # would recompute positions on every (re)draw
+        _FIG = plt.figure(figsize=(12, 8), layout='none')
+    _FIG_TEARDOWN.clear()
+
+    fig = _FIG
     fig.suptitle("Tax Welfare Analysis", fontsize=16, fontweight='bold', y=0.98)  # 提高主标题位置
 
     # Use GridSpec for better layout control
     gs = gridspec.GridSpec(2, 2, height_ratios=[3, 1], width_ratios=[3, 1])
 
     # Create axes
-    ax = plt.subplot(gs[0, 0])  # Supply and demand curves (main plot)
-    ax2 = plt.subplot(gs[1, 0])  # Welfare analysis (bottom left)
-    ax_controls = plt.subplot(gs[0:2, 1])  # Controls panel (right column)
+    ax = fig.add_subplot(gs[0, 0])  # Supply and demand curves (main plot)
+    ax2 = fig.add_subplot(gs[1, 0])  # Welfare analysis (bottom left)
+    ax_controls = fig.add_subplot(gs[0:2, 1])  # Controls panel (right column)
     ax_controls.set_axis_off()  # We'll create our own axes for controls
 
     # Adjust layout with more space at the top
-    plt.subplots_adjust(left=0.08, right=0.92, bottom=0.1, top=0.92,
+    fig.subplots_adjust(left=0.08, right=0.92, bottom=0.1, top=0.92,
                         hspace=0.3, wspace=0.3)
 
-    # Create quantity range (x-axis)
-    quantities = np.linspace(0, 200, 200)  # Reasonable quantity range
+    return fig, ax, ax2
+
+
+def create_interactive_game(demand_elasticity=-3.0, supply_elasticity=3.0, tax_max=10.0, tax_step=0.1):
+    """Create interactive game interface with adjustable elasticities"""
+    # Initialize simulator
+    sim = MarketSimulator(demand_elasticity, supply_elasticity)
 
-    # Calculate and plot demand curve (price as function of quantity)
-    demand_prices = [q / sim.demand_elasticity + sim.demand_intercept for q in quantities]
+    # Create figure with custom grid layout (reused across games)
+    fig, ax, ax2 = _build_layout()
+
+    # Create quantity range (x-axis)
+    # All curves are straight lines, so the two endpoints draw them exactly
+    quantities = np.linspace(0, 200, 2, dtype=np.float32)
+
+    # Demand (row 0) and supply (row 1) prices share the quantity axis,
+    # so compute both curves in one broadcast over a stacked array
+    curve_prices = np.empty((2, quantities.size), dtype=np.float32)
+    slopes = np.empty((2, 1), dtype=np.float32)
+    intercepts = np.empty((2, 1), dtype=np.float32)
+
+    def compute_curves(rows=slice(None)):
+        """按当前弹性原地计算曲线 (价格作为数量的函数), rows 为 0 (需求), 1 (供给) 或全部"""
+        slopes[0, 0] = 1 / sim.demand_elasticity
+        slopes[1, 0] = 1 / sim.supply_elasticity
+        intercepts[0, 0] = sim.demand_intercept
+        intercepts[1, 0] = sim.supply_intercept
+        np.multiply(quantities, slopes[rows], out=curve_prices[rows])
+        np.add(curve_prices[rows], intercepts[rows], out=curve_prices[rows])
+
+    compute_curves()
+    demand_prices, supply_prices = curve_prices  # 行视图
+
+    # Plot demand curve
     demand_line, = ax.plot(quantities, demand_prices, 'b-', linewidth=2.0)
 
-    # Calculate and plot supply curve
-    supply_prices = [q / sim.supply_elasticity + sim.supply_intercept for q in quantities]
+    # Plot supply curve
     supply_line, = ax.plot(quantities, supply_prices, 'r-', linewidth=2.0)
 
+    # 税率网格与税率滑块的取值一一对应, 含税供给曲线按 (税率, 数量) 一次性计算,
+    # 拖动税率滑块时只需按行取出. 滑块取值为 k * tax_step, 最后一档可能截断到 tax_max
+    tax_steps = int(np.ceil(tax_max / tax_step)) + 1
+    tax_grid = np.minimum(np.arange(tax_steps) * tax_step, tax_max).astype(np.float32)
+    taxed_supply_grid = supply_prices + tax_grid[:, None]
+
+    def tax_index(tax_rate):
+        """税率在 tax_grid 中的行号"""
+        if tax_rate >= tax_max:
+            return tax_steps - 1
+        return int(round(tax_rate / tax_step))
+
     # Find initial equilibrium
     consumer_price, quantity = sim.find_equilibrium()
 
@@ -141,7 +288,7 @@ def create_interactive_game():
 
     # 平衡点标签 - 美化版本
     eq_label = ax.annotate(
-        f'Price: {consumer_price:.2f}\nQuantity: {quantity:.2f}',
+        EQ_LABEL_FMT(price=consumer_price, quantity=quantity),
         xy=(quantity, consumer_price),
         xytext=(quantity, consumer_price + 2.5),  # 在点上方的固定位置
         textcoords='data',
@@ -158,14 +305,37 @@ def create_interactive_game():
     )
 
     # Create taxed supply curve (always visible in legend)
-    taxed_supply_prices = [q / sim.supply_elasticity + sim.supply_intercept + sim.tax_rate for q in quantities]
+    taxed_supply_prices = taxed_supply_grid[tax_index(sim.tax_rate)]
     supply_tax_line, = ax.plot(quantities, taxed_supply_prices, 'r--', linewidth=1.5)
 
+    # 福利区域 (消费者剩余, 生产者剩余, 税收, 无谓损失), 颜色与福利柱状图一致
+    cs_region = ax.add_patch(Polygon([[0, 0]], closed=True, fc='#1f77b4', alpha=0.2, lw=0))
+    ps_region = ax.add_patch(Polygon([[0, 0]], closed=True, fc='#ff7f0e', alpha=0.2, lw=0))
+    tax_region = ax.add_patch(Polygon([[0, 0]], closed=True, fc='#2ca02c', alpha=0.2, lw=0))
+    dwl_region = ax.add_patch(Polygon([[0, 0]], closed=True, fc='#d62728', alpha=0.3, lw=0))
+
+    def update_welfare_regions():
+        """根据当前均衡点更新福利区域的顶点"""
+        producer_price = consumer_price - sim.tax_rate
+        zero_tax_price, zero_tax_quantity = sim.find_zero_tax_equilibrium()
+
+        cs_region.set_xy([(0, sim.demand_intercept), (0, consumer_price), (quantity, consumer_price)])
+        ps_region.set_xy([(0, producer_price), (0, sim.supply_intercept), (quantity, producer_price)])
+        tax_region.set_xy([(0, producer_price), (0, consumer_price),
+                           (quantity, consumer_price), (quantity, producer_price)])
+        dwl_region.set_xy([(quantity, consumer_price), (quantity, producer_price),
+                           (zero_tax_quantity, zero_tax_price)])
+
+    update_welfare_regions()
+
     # Add legend with all elements including taxed supply
     ax.legend([demand_line, supply_line, supply_tax_line, eq_point],
               ['Demand', 'Supply', 'Taxed Supply', 'Equilibrium'],
               loc='upper right', fontsize=9, framealpha=0.9)
 
+    # 无税时含税供给曲线与供给曲线重合, 先隐藏 (图例已创建, 图例项仍然显示)
+    supply_tax_line.set_visible(sim.tax_rate > 0)
+
     # 图表标题居中显示，有合适间距
     ax.set_title("Supply and Demand Curves", fontsize=12, pad=10, y=1.0)  # 居中位置
     ax.title.set_position([0.5, 1.0])  # 确保标题在图表上方居中
@@ -182,6 +352,8 @@ def create_interactive_game():
     colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#9467bd', '#d62728']
     welfare_data = sim.calculate_welfare()
     welfare_bars = ax2.bar(welfare_labels, welfare_data, color=colors, alpha=0.85)
+    welfare_rects = welfare_bars.patches
+    ax2.set_ylim(0, welfare_data.max() * 1.2)
     ax2.set_ylabel('Value', fontsize=10)
     ax2.grid(True, linestyle='--', alpha=0.7, axis='y')
 
@@ -199,8 +371,8 @@ def create_interactive_game():
     tax_ax = fig.add_axes([0.75, 0.85, 0.2, 0.03])
     tax_slider = Slider(
         ax=tax_ax, label='Tax Rate',
-        valmin=0, valmax=10, valinit=sim.tax_rate,
-        valstep=0.1, color='#2ca02c',
+        valmin=0, valmax=tax_max, valinit=sim.tax_rate,
+        valstep=tax_step, color='#2ca02c',
         track_color='#e0f2e0',  # 浅绿色轨道
     )
     tax_ax.set_facecolor('#f8f8f8')  # 设置背景色
@@ -240,13 +412,13 @@ def create_interactive_game():
 
     # 初始化表格数据
     welfare_metrics = [
-        ("Equilibrium Price", f"{consumer_price:.2f}"),
-        ("Equilibrium Quantity", f"{quantity:.2f}"),
-        ("Consumer Surplus", f"{welfare_data[0]:.2f}"),
-        ("Producer Surplus", f"{welfare_data[1]:.2f}"),
-        ("Tax Revenue", f"{welfare_data[2]:.2f}"),
-        ("Total Welfare", f"{welfare_data[3]:.2f}"),
-        ("Deadweight Loss", f"{welfare_data[4]:.2f}")
+        ("Equilibrium Price", VALUE_FMT(consumer_price)),
+        ("Equilibrium Quantity", VALUE_FMT(quantity)),
+        ("Consumer Surplus", VALUE_FMT(welfare_data[0])),
+        ("Producer Surplus", VALUE_FMT(welfare_data[1])),
+        ("Tax Revenue", VALUE_FMT(welfare_data[2])),
+        ("Total Welfare", VALUE_FMT(welfare_data[3])),
+        ("Deadweight Loss", VALUE_FMT(welfare_data[4]))
     ]
 
     # 创建表格 - 使用更大的边界框和边框
@@ -264,6 +436,9 @@ def create_interactive_game():
     table.set_fontsize(10)  # 使用稍大的字体
     table.auto_set_column_width([0, 1])  # 自动调整列宽
 
+    # 缓存数值列单元格, 更新时直接使用
+    value_cells = [table.get_celld()[(i + 1, 1)] for i in range(len(welfare_metrics))]
+
     # 设置标题行样式
     for (row, col), cell in table.get_celld().items():
         if row == 0:  # 标题行
@@ -278,19 +453,81 @@ def create_interactive_game():
     # 存储参考线用于更新
     ref_lines = {
         'supply_tax_line': supply_tax_line,
-        'table': table,
         'eq_label': eq_label,
         'eq_point': eq_point
     }
 
+    # Blitting: 动态元素标记为 animated, 更新时只在缓存的静态背景上重绘它们.
+    # 不支持 blitting 的后端 (GTK4, WebAgg/nbAgg, Cairo 等) 保持普通元素, 每次完整重绘
+    canvas = fig.canvas
+    use_blit = canvas.supports_blit
+    animated_artists = []
+    if use_blit:
+        animated_artists = [cs_region, ps_region, tax_region, dwl_region,
+                            demand_line, supply_line, supply_tax_line, eq_point, eq_label,
+                            *welfare_rects, table]
+        for slider in (tax_slider, demand_elasticity_slider, supply_elasticity_slider):
+            slider.drawon = False  # 滑块自身不再触发整图重绘
+            # 滑块的填充条, 数值文字和拖动手柄随数值变化 (初始值标记线是静态的)
+            animated_artists += [slider.poly, slider.valtext,
+                                 *(line for line in slider.ax.lines if line is not slider.vline)]
+        animated_artists.sort(key=lambda artist: artist.get_zorder())
+        for artist in animated_artists:
+            artist.set_animated(True)
+
+    background = None  # 静态背景缓存, 每次完整重绘后更新
+
+    def draw_animated(renderer):
+        """绘制所有动态元素"""
+        for artist in animated_artists:
+            artist.draw(renderer)
+
+    def on_draw(event):
+        """完整重绘 (包括窗口缩放) 后重新缓存背景"""
+        nonlocal background
+        # 保存图片时使用临时画布, 只在屏幕画布上缓存背景
+        if event.canvas is canvas:
+            background = canvas.copy_from_bbox(fig.bbox)
+        draw_animated(event.renderer)
+
+    def blit():
+        """恢复背景并只重绘动态元素"""
+        if not use_blit or background is None:
+            fig.canvas.draw_idle()
+            return
+        canvas.restore_region(background)
+        draw_animated(canvas.get_renderer())
+        canvas.blit(fig.bbox)
+
+    # 当前曲线对应的弹性值和税率, 用于跳过没有变化的曲线
+    drawn_state = {'demand': sim.demand_elasticity, 'supply': sim.supply_elasticity, 'tax': sim.tax_rate}
+
     def update_elasticity():
         """更新弹性值并重新计算曲线"""
         # 更新弹性值
         sim.demand_elasticity = demand_elasticity_slider.val
         sim.supply_elasticity = supply_elasticity_slider.val
 
-        # 更新曲线
-        sim.update_curves()
+        demand_changed = sim.demand_elasticity != drawn_state['demand']
+        supply_changed = sim.supply_elasticity != drawn_state['supply']
+        if not (demand_changed or supply_changed):
+            return
+        drawn_state['demand'] = sim.demand_elasticity
+        drawn_state['supply'] = sim.supply_elasticity
+
+        # 更新曲线截距 (均衡点在 update 中重新计算)
+        sim.update_intercepts()
+
+        # 更新供需曲线 - 只依赖弹性, 与税率无关
+        # 原地写入已有数组, 不分配新内存 (set_ydata 会复制数据)
+        if demand_changed:
+            compute_curves(0)
+            demand_line.set_ydata(demand_prices)
+        if supply_changed:
+            compute_curves(1)
+            supply_line.set_ydata(supply_prices)
+            np.add(supply_prices, tax_grid[:, None], out=taxed_supply_grid)
+            drawn_state['tax'] = None  # 含税供给曲线需要重新设置
 
     def update(val):
         """更新图表"""
@@ -305,47 +542,46 @@ def create_interactive_game():
         # 重新计算福利
         welfare_data = sim.calculate_welfare()
 
-        # 更新供需曲线
-        demand_prices = [q / sim.demand_elasticity + sim.demand_intercept for q in quantities]
-        demand_line.set_ydata(demand_prices)
-        supply_prices = [q / sim.supply_elasticity + sim.supply_intercept for q in quantities]
-        supply_line.set_ydata(supply_prices)
+        # 注意: 需求曲线和无税供给曲线不依赖税率, 只在 update_elasticity 中更新,
+        # 这里不要重新设置它们
 
         # 更新均衡点和标签 - 标签随点一起移动
         ref_lines['eq_point'].set_data([quantity], [consumer_price])
         ref_lines['eq_label'].xy = (quantity, consumer_price)
         ref_lines['eq_label'].set_position((quantity, consumer_price + 2.5))
-        ref_lines['eq_label'].set_text(f'Price: {consumer_price:.2f}\nQuantity: {quantity:.2f}')
+        ref_lines['eq_label'].set_text(EQ_LABEL_FMT(price=consumer_price, quantity=quantity))
 
-        # 更新含税供给曲线
-        taxed_supply_prices = [q / sim.supply_elasticity + sim.supply_intercept + sim.tax_rate for q in quantities]
-        ref_lines['supply_tax_line'].set_ydata(taxed_supply_prices)
+        # 更新福利区域
+        update_welfare_regions()
+
+        # 更新含税供给曲线 - 只在税率或供给弹性变化后
+        if sim.tax_rate != drawn_state['tax']:
+            drawn_state['tax'] = sim.tax_rate
+            taxed_supply_prices = taxed_supply_grid[tax_index(sim.tax_rate)]
+            ref_lines['supply_tax_line'].set_ydata(taxed_supply_prices)
+            ref_lines['supply_tax_line'].set_visible(sim.tax_rate > 0)
 
         # 更新福利图表
-        for i, bar in enumerate(welfare_bars):
-            bar.set_height(welfare_data[i])
-
-        # 调整Y轴范围以适应新数据
-        max_value = max(welfare_data) * 1.2
-        ax2.set_ylim(0, max_value)
-
-        # 使用新值更新表格
-        new_metrics = [
-            ("Equilibrium Price", f"{consumer_price:.2f}"),
-            ("Equilibrium Quantity", f"{quantity:.2f}"),
-            ("Consumer Surplus", f"{welfare_data[0]:.2f}"),
-            ("Producer Surplus", f"{welfare_data[1]:.2f}"),
-            ("Tax Revenue", f"{welfare_data[2]:.2f}"),
-            ("Total Welfare", f"{welfare_data[3]:.2f}"),
-            ("Deadweight Loss", f"{welfare_data[4]:.2f}")
-        ]
-
-        # 更新表格数据
-        for i, (metric, value) in enumerate(new_metrics):
-            ref_lines['table'].get_celld()[(i + 1, 0)].get_text().set_text(metric)
-            ref_lines['table'].get_celld()[(i + 1, 1)].get_text().set_text(value)
-
-        fig.canvas.draw_idle()
+        for rect, height in zip(welfare_rects, welfare_data):
+            rect.set_height(height)
+
+        # 只在新数据超出当前范围或不到一半时调整Y轴, 避免每次都完整重绘
+        max_value = welfare_data.max() * 1.2
+        current_max = ax2.get_ylim()[1]
+        ylim_changed = max_value > current_max or max_value < current_max * 0.5
+        if ylim_changed:
+            ax2.set_ylim(0, max_value)
+
+        # 使用新值更新表格 (指标名称不变, 只更新数值列, 顺序与 welfare_metrics 一致)
+        new_values = (consumer_price, quantity, *welfare_data)
+        for cell, value in zip(value_cells, new_values):
+            cell.get_text().set_text(VALUE_FMT(value))
+
+        # 坐标轴刻度变化时需要完整重绘, 否则只 blit 动态元素
+        if ylim_changed:
+            fig.canvas.draw_idle()
+        else:
+            blit()
 
     def update_elasticity_and_chart(val):
         """更新弹性并更新图表"""
@@ -354,32 +590,65 @@ def create_interactive_game():
 
     def reset(event):
         """将市场重置为初始状态"""
-        nonlocal sim, consumer_price, quantity, welfare_data
+        nonlocal update_pending
 
-        # 重置为初始值
-        sim = MarketSimulator()
+        # 原地重置模拟器, 不重新创建对象
+        sim.reset()
 
-        # 更新滑块
+        # 更新滑块 - 弹性滑块会重新计算曲线
         tax_slider.set_val(0)
-        demand_elasticity_slider.set_val(-3.0)
-        supply_elasticity_slider.set_val(3.0)
-
-        # 获取初始值
-        consumer_price, quantity = sim.find_equilibrium()
-        welfare_data = sim.calculate_welfare()
+        demand_elasticity_slider.set_val(demand_elasticity)
+        supply_elasticity_slider.set_val(supply_elasticity)
 
-        # 更新图表
+        # 更新图表 - 直接更新, 取消税率滑块排队的更新 (重置不计入历史)
+        update_timer.stop()
+        update_pending = False
         update(None)
         fig.canvas.draw()
 
+    # 拖动税率滑块时事件非常密集, 合并到定时器中统一处理 (最多约 33 Hz)
+    update_pending = False
+    update_timer = canvas.new_timer(interval=30)
+    update_timer.single_shot = True
+
+    def flush_update():
+        """处理积压的税率变化"""
+        nonlocal update_pending
+        if update_pending:
+            update_pending = False
+            update(tax_slider.val)
+
+            # 只记录税率滑块引起的变化
+            sim.record_history(welfare_data[3])
+
+    def schedule_update(val):
+        """标记税率已变化, 推迟到定时器触发时再更新"""
+        nonlocal update_pending
+        if not update_pending:
+            update_pending = True
+            if timer_works:
+                update_timer.start()
+            else:
+                flush_update()
+
+    update_timer.add_callback(flush_update)
+    # 非 GUI 画布 (Agg, inline, 脚本调用) 只有不会触发的基础 TimerBase, 此时直接同步更新
+    timer_works = type(update_timer) is not TimerBase
+
     # 设置回调函数
-    tax_slider.on_changed(update)
+    tax_slider.on_changed(schedule_update)
     demand_elasticity_slider.on_changed(update_elasticity_and_chart)
     supply_elasticity_slider.on_changed(update_elasticity_and_chart)
     reset_button.on_clicked(reset)
-
-    # 初始更新
-    update(None)
+    if use_blit:
+        draw_cid = canvas.mpl_connect('draw_event', on_draw)
+        # 下一局复用本图时断开
+        _FIG_TEARDOWN.append(lambda: canvas.mpl_disconnect(draw_cid))
+
+    # 下一局复用本图时, 断开本局的控件和回调
+    _FIG_TEARDOWN.append(update_timer.stop)
+    for widget in (tax_slider, demand_elasticity_slider, supply_elasticity_slider, reset_button):
+        _FIG_TEARDOWN.append(widget.disconnect_events)
 
     # 添加美学改进
     fig.patch.set_facecolor('#f5f5f5')